@@ -1,8 +1,11 @@
 import streamlit as st
 import requests
-import pandas as pd
-import plotly.express as px
+import orjson
+from requests.adapters import HTTPAdapter
+import numpy as np
 import plotly.graph_objects as go
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import json
 import time
@@ -16,7 +19,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+_CSS_HTML = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -35,7 +38,97 @@ st.markdown("""
         text-align: center;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Static sidebar content, sent as a single markdown element
+_SIDEBAR_STATIC_MD = """
+---
+### 🛠️ Features
+- **API Integration**: Multiple free weather APIs
+- **Error Handling**: Robust exception management
+- **Data Visualization**: Interactive charts
+- **Real-time Monitoring**: Live data updates
+- **Responsive Design**: Mobile-friendly UI
+- **Fallback Systems**: Multiple data sources
+
+---
+### 🌐 Free APIs Used
+- **Open-Meteo**: Professional weather API
+- **wttr.in**: Terminal-style weather service
+- **No registration required!**
+"""
+
+_HEADER_HTML = '<h1 class="main-header">🌤️ Advanced Weather Dashboard</h1>'
+
+# Extended forecast: one flex row of per-day cards, wrapping on narrow screens
+_FORECAST_ROW_TMPL = '<div style="display: flex; flex-wrap: wrap; gap: 1rem;">{cards}</div>'
+_CARD_TMPL = (
+    '<div style="flex: 1 1 6rem; text-align: center; padding: 1rem; border: 1px solid #ddd; border-radius: 0.5rem;">'
+    '<strong>{date}</strong><br>'
+    '<div style="font-size: 2rem;">{icon}</div>'
+    '<small>{condition}</small><br>'
+    '<strong>{max_temp}°/{min_temp}°</strong>'
+    '</div>'
+)
+
+_FOOTER_HTML = """
+<div style="text-align: center; color: #666; padding: 2rem;">
+    <p>Built with Python, Streamlit, and Free Weather APIs</p>
+    <p>No API keys required! | Data from {api_source}</p>
+</div>
+"""
+
+st.markdown(_CSS_HTML, unsafe_allow_html=True)
+
+@st.cache_resource
+def _get_session():
+    """Shared keep-alive HTTP session that survives Streamlit reruns"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+# Leading-underscore args (_session) are skipped by Streamlit's cache hashing
+@st.cache_data(ttl=86400, max_entries=512, show_spinner=False)
+def _geocode(_session, city):
+    """Look up (lat, lon) for a city; cached since the mapping rarely changes"""
+    # Using Open-Meteo's free geocoding API
+    url = f"https://geocoding-api.open-meteo.com/v1/search?name={city}&count=1"
+    response = _session.get(url, timeout=10)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    if data.get('results'):
+        return data['results'][0]['latitude'], data['results'][0]['longitude']
+    return None, None
+
+# refresh_nonce is part of the cache key only, so a session's Refresh gets
+# fresh entries without evicting what other sessions are using
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_wttr(_session, base_url, city, refresh_nonce=0):
+    """Fetch wttr.in JSON for a city; cached briefly to spare reruns"""
+    # Get JSON format weather data
+    url = f"{base_url}/{city}?format=j1"
+    response = _session.get(url, timeout=10)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_openmeteo(_session, base_url, lat, lon, refresh_nonce=0):
+    """Fetch Open-Meteo forecast JSON; cached briefly to spare reruns"""
+    url = f"{base_url}/forecast"
+    params = {
+        'latitude': lat,
+        'longitude': lon,
+        'current': 'temperature_2m,relative_humidity_2m,wind_speed_10m,weather_code',
+        'hourly': 'temperature_2m,relative_humidity_2m,weather_code',
+        'daily': 'weather_code,temperature_2m_max,temperature_2m_min',
+        'timezone': 'auto',
+        'forecast_days': 7
+    }
+    response = _session.get(url, params=params, timeout=10)
+    response.raise_for_status()
+    return orjson.loads(response.content)
 
 class WeatherAPI:
     """Weather API handler class using multiple free services"""
@@ -45,114 +138,146 @@ class WeatherAPI:
         self.base_url = "https://wttr.in"
         # Alternative: Open-Meteo (also completely free)
         self.openmeteo_url = "https://api.open-meteo.com/v1"
+        # Pooled connections shared across reruns
+        self.session = _get_session()
         
-    def get_weather_data_wttr(self, city):
+    def get_weather_data_wttr(self, city, refresh_nonce=0):
         """Fetch current weather data from wttr.in (no API key needed)"""
         try:
-            # Get JSON format weather data
-            url = f"{self.base_url}/{city}?format=j1"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return _fetch_wttr(self.session, self.base_url, city, refresh_nonce)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             st.error(f"Error fetching weather data from wttr.in: {e}")
             return None
     
     def get_coordinates(self, city):
         """Get coordinates for a city using a free geocoding service"""
         try:
-            # Using Open-Meteo's free geocoding API
-            url = f"https://geocoding-api.open-meteo.com/v1/search?name={city}&count=1"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            if data.get('results'):
-                return data['results'][0]['latitude'], data['results'][0]['longitude']
-            return None, None
+            return _geocode(self.session, city.strip().lower())
         except:
             return None, None
     
-    def get_openmeteo_weather(self, lat, lon):
+    def get_openmeteo_weather(self, lat, lon, refresh_nonce=0):
         """Fetch weather data from Open-Meteo (completely free)"""
         try:
-            url = f"{self.openmeteo_url}/forecast"
-            params = {
-                'latitude': lat,
-                'longitude': lon,
-                'current': 'temperature_2m,relative_humidity_2m,wind_speed_10m,weather_code',
-                'hourly': 'temperature_2m,relative_humidity_2m,weather_code',
-                'daily': 'weather_code,temperature_2m_max,temperature_2m_min',
-                'timezone': 'auto',
-                'forecast_days': 7
-            }
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            # Round so near-identical coordinates share a cache entry
+            return _fetch_openmeteo(self.session, self.openmeteo_url,
+                                    round(lat, 3), round(lon, 3), refresh_nonce)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             st.error(f"Error fetching data from Open-Meteo: {e}")
             return None
 
+    def get_weather_with_fallback(self, city, refresh_nonce=0):
+        """Fetch Open-Meteo data, requesting wttr.in in parallel as a fallback"""
+        # Start wttr.in while geocoding + forecast run serially on this thread
+        ctx = get_script_run_ctx()
+        pool = ThreadPoolExecutor(max_workers=1,
+                                  initializer=lambda: add_script_run_ctx(ctx=ctx))
+        fallback = pool.submit(_fetch_wttr, self.session, self.base_url, city, refresh_nonce)
+        pool.shutdown(wait=False)
+
+        try:
+            lat, lon = _geocode(self.session, city.strip().lower())
+            # Flag a city geocoding found no match for, so callers can say so
+            city_unknown = lat is None
+        except Exception:
+            # A geocoding failure is an outage, not an unknown city
+            lat, lon = None, None
+            city_unknown = False
+        if lat and lon:
+            weather_data = self.get_openmeteo_weather(lat, lon, refresh_nonce)
+            if weather_data:
+                return weather_data, "open-meteo", False
+        try:
+            return fallback.result(), "wttr", city_unknown
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError):
+            return None, None, city_unknown
+
+@st.cache_resource
+def _get_api():
+    """Single WeatherAPI instance shared across reruns"""
+    return WeatherAPI()
+
+# WMO Weather interpretation codes (used by Open-Meteo)
+_WMO_ICON_MAP = {
+    0: "☀️",   # Clear sky
+    1: "🌤️",   # Mainly clear
+    2: "⛅",   # Partly cloudy
+    3: "☁️",   # Overcast
+    45: "🌫️",  # Fog
+    48: "🌫️",  # Depositing rime fog
+    51: "🌦️",  # Light drizzle
+    53: "🌦️",  # Moderate drizzle
+    55: "🌧️",  # Dense drizzle
+    61: "🌧️",  # Slight rain
+    63: "🌧️",  # Moderate rain
+    65: "🌧️",  # Heavy rain
+    71: "❄️",  # Slight snow
+    73: "❄️",  # Moderate snow
+    75: "🌨️",  # Heavy snow
+    77: "❄️",  # Snow grains
+    80: "🌦️",  # Slight rain showers
+    81: "🌧️",  # Moderate rain showers
+    82: "🌧️",  # Violent rain showers
+    85: "🌨️",  # Slight snow showers
+    86: "🌨️",  # Heavy snow showers
+    95: "⛈️",  # Thunderstorm
+    96: "⛈️",  # Thunderstorm with slight hail
+    99: "⛈️"   # Thunderstorm with heavy hail
+}
+
+_WMO_DESC_MAP = {
+    0: "Clear sky",
+    1: "Mainly clear",
+    2: "Partly cloudy",
+    3: "Overcast",
+    45: "Fog",
+    48: "Depositing rime fog",
+    51: "Light drizzle",
+    53: "Moderate drizzle",
+    55: "Dense drizzle",
+    61: "Slight rain",
+    63: "Moderate rain",
+    65: "Heavy rain",
+    71: "Slight snow fall",
+    73: "Moderate snow fall",
+    75: "Heavy snow fall",
+    77: "Snow grains",
+    80: "Slight rain showers",
+    81: "Moderate rain showers",
+    82: "Violent rain showers",
+    85: "Slight snow showers",
+    86: "Heavy snow showers",
+    95: "Thunderstorm",
+    96: "Thunderstorm with slight hail",
+    99: "Thunderstorm with heavy hail"
+}
+
+# Codes are bounded by 99, so flatten the maps into tuples indexed by code
+_WMO_ICON = tuple(_WMO_ICON_MAP.get(code, "🌤️") for code in range(100))
+_WMO_DESC = tuple(_WMO_DESC_MAP.get(code, "Unknown") for code in range(100))
+
+def _wmo_index(code):
+    """Return code as a lookup-table index, or None if it isn't a known slot"""
+    # Open-Meteo can send null (or 3.0) for weather_code; match dict.get semantics
+    try:
+        index = int(code)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return index if index == code and 0 <= index < 100 else None
+
 def get_weather_icon_from_code(code):
     """Map weather codes to emojis for different APIs"""
-    # WMO Weather interpretation codes (used by Open-Meteo)
-    wmo_codes = {
-        0: "☀️",   # Clear sky
-        1: "🌤️",   # Mainly clear
-        2: "⛅",   # Partly cloudy
-        3: "☁️",   # Overcast
-        45: "🌫️",  # Fog
-        48: "🌫️",  # Depositing rime fog
-        51: "🌦️",  # Light drizzle
-        53: "🌦️",  # Moderate drizzle
-        55: "🌧️",  # Dense drizzle
-        61: "🌧️",  # Slight rain
-        63: "🌧️",  # Moderate rain
-        65: "🌧️",  # Heavy rain
-        71: "❄️",  # Slight snow
-        73: "❄️",  # Moderate snow
-        75: "🌨️",  # Heavy snow
-        77: "❄️",  # Snow grains
-        80: "🌦️",  # Slight rain showers
-        81: "🌧️",  # Moderate rain showers
-        82: "🌧️",  # Violent rain showers
-        85: "🌨️",  # Slight snow showers
-        86: "🌨️",  # Heavy snow showers
-        95: "⛈️",  # Thunderstorm
-        96: "⛈️",  # Thunderstorm with slight hail
-        99: "⛈️"   # Thunderstorm with heavy hail
-    }
-    return wmo_codes.get(code, "🌤️")
+    index = _wmo_index(code)
+    return "🌤️" if index is None else _WMO_ICON[index]
 
 def get_weather_description(code):
     """Get weather description from WMO code"""
-    descriptions = {
-        0: "Clear sky",
-        1: "Mainly clear",
-        2: "Partly cloudy",
-        3: "Overcast",
-        45: "Fog",
-        48: "Depositing rime fog",
-        51: "Light drizzle",
-        53: "Moderate drizzle",
-        55: "Dense drizzle",
-        61: "Slight rain",
-        63: "Moderate rain",
-        65: "Heavy rain",
-        71: "Slight snow fall",
-        73: "Moderate snow fall",
-        75: "Heavy snow fall",
-        77: "Snow grains",
-        80: "Slight rain showers",
-        81: "Moderate rain showers",
-        82: "Violent rain showers",
-        85: "Slight snow showers",
-        86: "Heavy snow showers",
-        95: "Thunderstorm",
-        96: "Thunderstorm with slight hail",
-        99: "Thunderstorm with heavy hail"
-    }
-    return descriptions.get(code, "Unknown")
+    index = _wmo_index(code)
+    return "Unknown" if index is None else _WMO_DESC[index]
 
+# Figures are cached as shared objects (cache_data would pickle them, and
+# unpickling a Plotly figure rebuilds it); callers must not mutate them
+@st.cache_resource(ttl=300, max_entries=64, show_spinner=False)
 def create_temperature_gauge(temp, min_temp=-20, max_temp=50):
     """Create a temperature gauge chart"""
     fig = go.Figure(go.Indicator(
@@ -179,17 +304,18 @@ def create_temperature_gauge(temp, min_temp=-20, max_temp=50):
     fig.update_layout(height=300)
     return fig
 
-def create_forecast_chart(weather_data):
-    """Create a forecast line chart using Open-Meteo data"""
-    if not weather_data or 'hourly' not in weather_data:
-        return None
+@st.cache_resource(ttl=300, max_entries=64, show_spinner=False)
+def create_forecast_chart(times, temps, humidity):
+    """Create a forecast line chart from Open-Meteo hourly series (as tuples)"""
+    # Imported lazily so pandas only loads once a forecast chart is built
+    from pandas import to_datetime
     
-    hourly = weather_data['hourly']
-    
-    # Get next 24 hours of data
-    times = [datetime.fromisoformat(t.replace('Z', '+00:00')) for t in hourly['time'][:24]]
-    temps = hourly['temperature_2m'][:24]
-    humidity = hourly['relative_humidity_2m'][:24]
+    # Parse all timestamps in one vectorized call (handles a trailing 'Z' too)
+    times = to_datetime(list(times))
+    # Compact numeric arrays serialize faster and smaller than Python lists
+    # (float32 for humidity too, so a missing reading becomes NaN)
+    temps = np.asarray(temps, dtype=np.float32)
+    humidity = np.asarray(humidity, dtype=np.float32)
     
     # Create subplot
     fig = go.Figure()
@@ -226,8 +352,7 @@ def create_forecast_chart(weather_data):
 
 def main():
     # Header
-    st.markdown('<h1 class="main-header">🌤️ Advanced Weather Dashboard</h1>', 
-                unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     st.markdown("**Cloud Engineering Weather App** | Real-time weather monitoring with free APIs")
     
     # Sidebar for configuration
@@ -254,47 +379,53 @@ def main():
         
         # Refresh button
         if st.button("🔄 Refresh Data"):
+            # New nonce for this session only, so the next fetch misses the
+            # shared response cache; a timestamp can't collide across sessions
+            st.session_state["refresh_nonce"] = time.time_ns()
+            st.session_state.pop("last_key", None)
             st.rerun()
         
-        st.markdown("---")
-        st.markdown("### 🛠️ Features")
-        st.markdown("""
-        - **API Integration**: Multiple free weather APIs
-        - **Error Handling**: Robust exception management
-        - **Data Visualization**: Interactive charts
-        - **Real-time Monitoring**: Live data updates
-        - **Responsive Design**: Mobile-friendly UI
-        - **Fallback Systems**: Multiple data sources
-        """)
-        
-        st.markdown("---")
-        st.markdown("### 🌐 Free APIs Used")
-        st.markdown("""
-        - **Open-Meteo**: Professional weather API
-        - **wttr.in**: Terminal-style weather service
-        - **No registration required!**
-        """)
+        st.markdown(_SIDEBAR_STATIC_MD)
     
-    # Initialize weather API
-    weather_api = WeatherAPI()
+    # Reuse the weather API (and its pooled session) across reruns
+    weather_api = _get_api()
+    refresh_nonce = st.session_state.get("refresh_nonce", 0)
     
-    # Fetch data based on selected source
-    with st.spinner(f"Fetching weather data for {city}..."):
-        if api_source == "Open-Meteo (Recommended)":
-            # Get coordinates first
-            lat, lon = weather_api.get_coordinates(city)
-            if lat and lon:
-                weather_data = weather_api.get_openmeteo_weather(lat, lon)
-                data_source = "open-meteo"
+    # Reuse the last payload when city and source are unchanged (and it's
+    # within the same 5 minute TTL as the response caches)
+    fetch_key = (city.strip().lower(), api_source)
+    if (st.session_state.get("last_key") == fetch_key
+            and "last_payload" in st.session_state
+            and time.time() - st.session_state.get("last_fetched", 0) < 300):
+        weather_data, data_source, city_unknown = st.session_state["last_payload"]
+    else:
+        # Fetch data based on selected source
+        with st.spinner(f"Fetching weather data for {city}..."):
+            if api_source == "Open-Meteo (Recommended)":
+                weather_data, data_source, city_unknown = weather_api.get_weather_with_fallback(
+                    city, refresh_nonce)
             else:
-                st.error(f"❌ Could not find coordinates for {city}")
-                return
+                weather_data = weather_api.get_weather_data_wttr(city, refresh_nonce)
+                data_source = "wttr"
+                city_unknown = False
+        
+        if weather_data:
+            st.session_state["last_key"] = fetch_key
+            st.session_state["last_payload"] = (weather_data, data_source, city_unknown)
+            st.session_state["last_fetched"] = time.time()
+    
+    if api_source == "Open-Meteo (Recommended)" and data_source == "wttr":
+        if city_unknown:
+            st.warning(f"⚠️ Open-Meteo could not find coordinates for {city}, showing wttr.in data instead")
         else:
-            weather_data = weather_api.get_weather_data_wttr(city)
-            data_source = "wttr"
+            st.warning(f"⚠️ Open-Meteo unavailable for {city}, showing wttr.in data instead")
+        api_source = "wttr.in"
     
     if not weather_data:
-        st.error("❌ Failed to fetch weather data. Please try a different city or data source.")
+        if city_unknown:
+            st.error(f"❌ Could not find coordinates for {city}")
+        else:
+            st.error("❌ Failed to fetch weather data. Please try a different city or data source.")
         return
     
     # Process and display data based on source
@@ -390,7 +521,7 @@ def main():
         <h3 style="text-align: center;">{weather_desc}</h3>
         <p style="text-align: center; color: #666;">
             {city}<br>
-            Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br>
+            Last updated: {datetime.fromtimestamp(st.session_state['last_fetched']).strftime('%Y-%m-%d %H:%M:%S')}<br>
             <small>Data source: {api_source}</small>
         </p>
         """, unsafe_allow_html=True)
@@ -405,8 +536,14 @@ def main():
     with col2:
         # Forecast chart (only available for Open-Meteo)
         if data_source == "open-meteo":
-            forecast_fig = create_forecast_chart(weather_data)
-            if forecast_fig:
+            hourly = weather_data.get('hourly')
+            if hourly:
+                # Next 24 hours, as tuples so the figure cache key stays small
+                forecast_fig = create_forecast_chart(
+                    tuple(hourly['time'][:24]),
+                    tuple(hourly['temperature_2m'][:24]),
+                    tuple(hourly['relative_humidity_2m'][:24])
+                )
                 st.plotly_chart(forecast_fig, use_container_width=True)
         else:
             st.info("📊 Hourly forecast charts available with Open-Meteo source")
@@ -432,60 +569,51 @@ def main():
     if data_source == "open-meteo":
         # Open-Meteo daily forecast
         daily_data = weather_data['daily']
-        forecast_cols = st.columns(5)
         
-        for i in range(5):
-            with forecast_cols[i]:
-                date = datetime.fromisoformat(daily_data['time'][i]).strftime('%a %m/%d')
-                max_temp = daily_data['temperature_2m_max'][i]
-                min_temp = daily_data['temperature_2m_min'][i]
-                weather_code = daily_data['weather_code'][i]
-                icon = get_weather_icon_from_code(weather_code)
-                condition = get_weather_description(weather_code)
-                
-                st.markdown(f"""
-                <div style="text-align: center; padding: 1rem; border: 1px solid #ddd; border-radius: 0.5rem;">
-                    <strong>{date}</strong><br>
-                    <div style="font-size: 2rem;">{icon}</div>
-                    <small>{condition}</small><br>
-                    <strong>{max_temp:.0f}°/{min_temp:.0f}°</strong>
-                </div>
-                """, unsafe_allow_html=True)
+        # Slice each column once, then walk the days as zipped tuples
+        dates = [datetime.fromisoformat(t).strftime('%a %m/%d') for t in daily_data['time'][:5]]
+        codes = daily_data['weather_code'][:5]
+        maxs = daily_data['temperature_2m_max'][:5]
+        mins = daily_data['temperature_2m_min'][:5]
+        
+        cards = [
+            _CARD_TMPL.format_map({
+                'date': date,
+                'icon': get_weather_icon_from_code(code),
+                'condition': get_weather_description(code),
+                'max_temp': f"{max_temp:.0f}",
+                'min_temp': f"{min_temp:.0f}"
+            })
+            for date, code, max_temp, min_temp in zip(dates, codes, maxs, mins)
+        ]
     
     else:
         # wttr.in forecast (up to 3 days)
-        forecast_cols = st.columns(min(3, len(weather_data['weather'])))
+        cards = []
         
         for i, day_weather in enumerate(weather_data['weather'][:3]):
-            with forecast_cols[i]:
-                if i == 0:
-                    date = "Today"
-                elif i == 1:
-                    date = "Tomorrow"
-                else:
-                    date = f"Day {i+1}"
-                
-                max_temp = day_weather['maxtempC']
-                min_temp = day_weather['mintempC']
-                condition = day_weather['hourly'][4]['weatherDesc'][0]['value']  # Midday weather
-                
-                st.markdown(f"""
-                <div style="text-align: center; padding: 1rem; border: 1px solid #ddd; border-radius: 0.5rem;">
-                    <strong>{date}</strong><br>
-                    <div style="font-size: 2rem;">🌤️</div>
-                    <small>{condition}</small><br>
-                    <strong>{max_temp}°/{min_temp}°</strong>
-                </div>
-                """, unsafe_allow_html=True)
+            if i == 0:
+                date = "Today"
+            elif i == 1:
+                date = "Tomorrow"
+            else:
+                date = f"Day {i+1}"
+            
+            max_temp = day_weather['maxtempC']
+            min_temp = day_weather['mintempC']
+            condition = day_weather['hourly'][4]['weatherDesc'][0]['value']  # Midday weather
+            
+            cards.append(_CARD_TMPL.format_map({
+                'date': date, 'icon': "🌤️", 'condition': condition,
+                'max_temp': max_temp, 'min_temp': min_temp
+            }))
+    
+    # One flex row instead of one markdown element per column
+    st.markdown(_FORECAST_ROW_TMPL.format(cards="".join(cards)), unsafe_allow_html=True)
     
     # Footer
     st.markdown("---")
-    st.markdown(f"""
-    <div style="text-align: center; color: #666; padding: 2rem;">
-        <p>Built with Python, Streamlit, and Free Weather APIs</p>
-        <p>No API keys required! | Data from {api_source}</p>        
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_FOOTER_HTML.format(api_source=api_source), unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file